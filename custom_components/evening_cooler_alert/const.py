@@ -25,4 +25,8 @@ DEFAULT_BODY_TEMPLATE = (
 
 STORAGE_KEY_FMT = DOMAIN + ".{}"
 STORAGE_VERSION = 1
+STORAGE_MINOR_VERSION = 2
+STORAGE_SAVE_DELAY = 10
+# One sample per 5-minute evening tick, so 12 covers the last hour
+RECENT_SAMPLES_MAX = 12
 
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta, time
 from typing import Any, Callable, Optional
 
@@ -14,6 +15,7 @@ from homeassistant.helpers.event import (
     async_track_point_in_time,
     async_track_sunset,
 )
+from homeassistant.helpers.start import async_at_started
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.template import Template
 from homeassistant.util.dt import now as dt_now, as_local, parse_time
@@ -22,6 +24,9 @@ from .const import (
     DOMAIN,
     STORAGE_KEY_FMT,
     STORAGE_VERSION,
+    STORAGE_MINOR_VERSION,
+    STORAGE_SAVE_DELAY,
+    RECENT_SAMPLES_MAX,
     CONF_CLIMATE_ENTITY,
     CONF_OUTDOOR_ENTITY,
     CONF_DELTA,
@@ -41,6 +46,43 @@ _LOGGER = logging.getLogger(__name__)
 class StoredState:
     sent_today: bool = False
     last_sent_iso: Optional[str] = None
+    # Added in storage minor version 2 so in-flight evening state survives a restart
+    saved_iso: Optional[str] = None
+    pending_stability_iso: Optional[str] = None
+    last_sunset_iso: Optional[str] = None
+    recent_samples: list[dict[str, Any]] = field(default_factory=list)
+    config: Optional[dict[str, Any]] = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "StoredState":
+        return cls(
+            sent_today=bool(data.get("sent_today", False)),
+            last_sent_iso=data.get("last_sent_iso"),
+            saved_iso=data.get("saved_iso"),
+            pending_stability_iso=data.get("pending_stability_iso"),
+            last_sunset_iso=data.get("last_sunset_iso"),
+            recent_samples=list(data.get("recent_samples") or []),
+            config=data.get("config"),
+        )
+
+
+class CoolerAlertStore(Store[dict[str, Any]]):
+    async def _async_migrate_func(
+        self, old_major_version: int, old_minor_version: int, old_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        if old_major_version == 1 and old_minor_version < 2:
+            # 1.1 only held sent_today/last_sent_iso; fill in the snapshot fields
+            return asdict(StoredState.from_dict(old_data))
+        return old_data
+
+
+def _parse_iso(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return as_local(datetime.fromisoformat(value))
+    except Exception:  # noqa: BLE001
+        return None
 
 
 class CoolerAlertCoordinator:
@@ -66,20 +108,46 @@ class CoolerAlertCoordinator:
         self._listeners: list[Callable[[], None]] = []
         self._every5_listener: Optional[Callable[[], None]] = None
         self._pending_stability: Optional[Callable[[], None]] = None
-
-        self.store = Store[dict[str, Any]](
-            self.hass, STORAGE_VERSION, STORAGE_KEY_FMT.format(self.entry.entry_id)
+        self._pending_deadline: Optional[datetime] = None
+        self._started_listener: Optional[Callable[[], None]] = None
+        self._resume_pending: bool = False
+        self._config_changed: bool = False
+
+        self.store = CoolerAlertStore(
+            self.hass,
+            STORAGE_VERSION,
+            STORAGE_KEY_FMT.format(self.entry.entry_id),
+            minor_version=STORAGE_MINOR_VERSION,
         )
         self.sent_today: bool = False
         self.last_sent: Optional[datetime] = None
 
         self._last_sunset: Optional[datetime] = None
+        self._recent_samples: deque[dict[str, Any]] = deque(maxlen=RECENT_SAMPLES_MAX)
 
     async def async_start(self) -> None:
-        await self._async_load_store()
+        resumed = await self._async_load_store()
         self._setup_listeners()
-        # Initial compute for attributes
-        await self.async_evaluate("startup")
+        if not resumed:
+            # Initial compute for attributes
+            await self.async_evaluate("startup")
+            return
+        # Sensors are often still unavailable while HA starts; resuming before
+        # then would let the first evaluation drop the saved deadline
+        self._resume_pending = True
+        self._started_listener = async_at_started(self.hass, self._async_resume)
+
+    async def _async_resume(self, _hass: HomeAssistant) -> None:
+        self._resume_pending = False
+        self._started_listener = None
+        if self._config_changed:
+            # Saved deadline was dropped on load; evaluate under the new settings
+            self._config_changed = False
+            await self.async_evaluate("config_change")
+            return
+        # Warm restart: re-arm timers from the snapshot without re-evaluating
+        self._resume_stability()
+        self._async_request_entity_updates()
 
     def _cfg(self, key: str, default: Any | None = None) -> Any:
         if key in self.options:
@@ -99,7 +167,20 @@ class CoolerAlertCoordinator:
             except Exception:  # noqa: BLE001
                 pass
             self._every5_listener = None
-        self._cancel_stability()
+        if self._started_listener:
+            try:
+                self._started_listener()
+            except Exception:  # noqa: BLE001
+                pass
+            self._started_listener = None
+        # Drop the timer but keep its deadline so a reload can resume it
+        if self._pending_stability is not None:
+            try:
+                self._pending_stability()
+            except Exception:  # noqa: BLE001
+                pass
+            self._pending_stability = None
+        await self._async_save_store()
 
     def _normalize_notify_service(self, value: str) -> str:
         value = value.strip()
@@ -107,24 +188,85 @@ class CoolerAlertCoordinator:
             return value
         return f"notify.{value}"
 
-    async def _async_load_store(self) -> None:
+    async def _async_load_store(self) -> bool:
+        """Restore the stored snapshot; return True if it can be resumed as-is."""
         data = await self.store.async_load()
-        if data:
-            self.sent_today = bool(data.get("sent_today", False))
-            last = data.get("last_sent_iso")
-            if last:
-                try:
-                    self.last_sent = as_local(datetime.fromisoformat(last))
-                except Exception:  # noqa: BLE001
-                    self.last_sent = None
+        if not data:
+            return False
+        state = StoredState.from_dict(data)
+        self.sent_today = state.sent_today
+        self.last_sent = _parse_iso(state.last_sent_iso)
+
+        saved = _parse_iso(state.saved_iso)
+        if saved is None:
+            # No snapshot saved since the 1.1 -> 1.2 migration: nothing in-flight
+            return False
+        boundary = self._last_reset_boundary()
+        if saved < boundary:
+            # The daily reset passed while we were down
+            self.sent_today = False
+            return False
+
+        last_sunset = _parse_iso(state.last_sunset_iso)
+        # A sunset from before the reset belongs to yesterday's evening
+        if last_sunset is not None and last_sunset >= boundary:
+            self._last_sunset = last_sunset
+        self._recent_samples.extend(state.recent_samples)
+        if state.config != self._config_fingerprint():
+            # Options changed (reload): the saved deadline used the old settings
+            self._config_changed = True
+        else:
+            self._pending_deadline = _parse_iso(state.pending_stability_iso)
+        return True
+
+    def _config_fingerprint(self) -> dict[str, Any]:
+        return {
+            "climate_entity": self.climate_entity,
+            "outdoor_entity": self.outdoor_entity,
+            "delta": self.delta,
+            "sunset_offset_min": self.sunset_offset_min,
+            "evening_latest": self.evening_latest,
+            "stability_window": self.stability_window,
+        }
+
+    def _snapshot(self) -> dict[str, Any]:
+        return asdict(
+            StoredState(
+                sent_today=self.sent_today,
+                last_sent_iso=self.last_sent.isoformat() if self.last_sent else None,
+                saved_iso=as_local(dt_now()).isoformat(),
+                pending_stability_iso=(
+                    self._pending_deadline.isoformat() if self._pending_deadline else None
+                ),
+                last_sunset_iso=self._last_sunset.isoformat() if self._last_sunset else None,
+                recent_samples=list(self._recent_samples),
+                config=self._config_fingerprint(),
+            )
+        )
 
     async def _async_save_store(self) -> None:
-        await self.store.async_save(
-            {
-                "sent_today": self.sent_today,
-                "last_sent_iso": self.last_sent.isoformat() if self.last_sent else None,
-            }
+        await self.store.async_save(self._snapshot())
+
+    @callback
+    def _schedule_save(self) -> None:
+        # Batched write for non-critical changes (sunset, stability timers)
+        self.store.async_delay_save(self._snapshot, STORAGE_SAVE_DELAY)
+
+    def _reset_time(self) -> time:
+        reset_t = parse_time(self.daily_reset)
+        if reset_t is None:
+            reset_t = time(12, 0)
+        return reset_t
+
+    def _last_reset_boundary(self, when: Optional[datetime] = None) -> datetime:
+        when = as_local(when or dt_now())
+        reset_t = self._reset_time()
+        boundary = when.replace(
+            hour=reset_t.hour, minute=reset_t.minute, second=0, microsecond=0
         )
+        if boundary > when:
+            boundary -= timedelta(days=1)
+        return boundary
 
     def _setup_listeners(self) -> None:
         # State change listeners
@@ -146,9 +288,7 @@ class CoolerAlertCoordinator:
         )
 
         # Daily reset
-        reset_t = parse_time(self.daily_reset)
-        if reset_t is None:
-            reset_t = time(12, 0)
+        reset_t = self._reset_time()
         self._listeners.append(
             async_track_time_change(
                 self.hass, self._handle_daily_reset, hour=reset_t.hour, minute=reset_t.minute, second=0
@@ -162,20 +302,22 @@ class CoolerAlertCoordinator:
     @callback
     async def _handle_sunset(self, _dt: datetime) -> None:
         self._last_sunset = _dt
+        self._schedule_save()
         await self.async_evaluate("sunset")
 
     @callback
     async def _handle_every5(self, now_dt: datetime) -> None:
         # Only evaluate in evening window
         if self._is_evening(now_dt):
+            self._record_sample()
             await self.async_evaluate("every5")
 
     @callback
     async def _handle_daily_reset(self, _dt: datetime) -> None:
         self.sent_today = False
-        await self._async_save_store()
         # Also clear pending stability
         self._cancel_stability()
+        await self._async_save_store()
         # Entities can update
         self._async_request_entity_updates()
 
@@ -226,10 +368,23 @@ class CoolerAlertCoordinator:
             return False
         return outside < (inside - self.delta)
 
+    def _record_sample(self) -> None:
+        # One sample per evening tick, written with the next snapshot save
+        inside, outside = self._get_inside_outside()
+        if inside is None or outside is None:
+            return
+        self._recent_samples.append(
+            {"ts": as_local(dt_now()).isoformat(), "inside": inside, "outside": outside}
+        )
+
     async def async_evaluate(self, reason: str) -> None:
         # Update attributes on entities
         self._async_request_entity_updates()
 
+        if self._resume_pending:
+            # Waiting for HA to start before resuming the saved snapshot
+            return
+
         if not self._is_evening():
             self._cancel_stability()
             return
@@ -247,24 +402,48 @@ class CoolerAlertCoordinator:
             if self._pending_stability is None:
                 when = dt_now() + timedelta(seconds=self.stability_window)
                 _LOGGER.debug("Scheduling stability confirmation at %s (%s)", when, reason)
-                self._pending_stability = async_track_point_in_time(
-                    self.hass, self._confirm_and_fire, when
-                )
+                self._schedule_stability(when)
+                self._schedule_save()
             return
         # Fire immediately
         await self._fire_notification()
 
+    def _schedule_stability(self, when: datetime) -> None:
+        self._pending_deadline = when
+        self._pending_stability = async_track_point_in_time(
+            self.hass, self._confirm_and_fire, when
+        )
+
+    def _resume_stability(self) -> None:
+        when = self._pending_deadline
+        if when is None:
+            return
+        if self.sent_today or not self._is_evening():
+            self._pending_deadline = None
+            self._schedule_save()
+            return
+        # A deadline that passed while we were down confirms right away
+        when = max(when, dt_now())
+        _LOGGER.debug("Resuming stability confirmation at %s", when)
+        self._schedule_stability(when)
+
     def _cancel_stability(self) -> None:
+        had_deadline = self._pending_deadline is not None
+        self._pending_deadline = None
         if self._pending_stability is not None:
             try:
                 self._pending_stability()
             except Exception:  # noqa: BLE001
                 pass
             self._pending_stability = None
+        if had_deadline:
+            self._schedule_save()
 
     @callback
     async def _confirm_and_fire(self, _dt: datetime) -> None:
         self._pending_stability = None
+        self._pending_deadline = None
+        self._schedule_save()
         if self._is_evening() and not self.sent_today and self.condition_holds():
             await self._fire_notification()
 
@@ -317,6 +496,10 @@ class CoolerAlertCoordinator:
             "sunset_offset_min": self.sunset_offset_min,
             "last_sunset": self._last_sunset.isoformat() if self._last_sunset else None,
             "stability_window": self.stability_window,
+            "recent_samples": list(self._recent_samples),
+            "stability_deadline": (
+                self._pending_deadline.isoformat() if self._pending_deadline else None
+            ),
             "evening_latest": self.evening_latest,
             "daily_reset": self.daily_reset,
         }